@@ -0,0 +1,94 @@
+"""Board primitives for the Tkinter Tetris game and headless simulations.
+
+The playfield holds one bitmask per row (bit x set = column x filled). The
+plain functions work on a list of row masks and are what the GUI uses: a
+jitted call from Python costs more than these few integer operations, and the
+game is bound by Tk anyway.
+
+Headless callers that drive the board in a tight loop (an AI or self-play
+harness) can use the ``*_jit`` variants instead. When Numba is installed they
+are compiled with ``numba.njit`` and expect the ``array("i")`` playfield from
+``new_row_masks_jit``, which they take through the buffer protocol; call
+``warm_up`` once to compile them ahead of time. Without Numba the ``*_jit``
+names are the plain functions, so callers need no special casing.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import List, MutableSequence, Tuple
+
+RotationRows = Tuple[Tuple[int, int], ...]
+# Either a list (the plain functions) or an array("i") (the compiled ones).
+RowMasks = MutableSequence[int]
+
+
+def new_row_masks(height: int) -> List[int]:
+    """Return an empty playfield of ``height`` rows."""
+    return [0] * height
+
+
+def fits(row_masks: RowMasks, rows: RotationRows, py: int, height: int) -> bool:
+    """Check board-aligned ``(dy, bits)`` rows at ``py`` against the playfield.
+
+    Rows above the top of the board (negative y) never collide.
+    """
+    for dy, bits in rows:
+        y = py + dy
+        if y >= height or (y >= 0 and bits & row_masks[y]):
+            return False
+    return True
+
+
+def clear_full_rows(row_masks: List[int], full: int) -> int:
+    """Drop rows equal to ``full`` in place and return how many were removed."""
+    kept = [mask for mask in row_masks if mask != full]
+    cleared = len(row_masks) - len(kept)
+    if cleared:
+        row_masks[:] = [0] * cleared + kept
+    return cleared
+
+
+def _new_array_row_masks(height: int) -> array:
+    return array("i", [0]) * height
+
+
+def _compact_full_rows(row_masks: RowMasks, full: int) -> int:
+    # Loop form of clear_full_rows for Numba, which cannot build the lists.
+    write = len(row_masks) - 1
+    for read in range(len(row_masks) - 1, -1, -1):
+        mask = row_masks[read]
+        if mask != full:
+            row_masks[write] = mask
+            write -= 1
+    for y in range(write + 1):
+        row_masks[y] = 0
+    return write + 1
+
+
+try:
+    from numba import njit
+except ImportError:
+    JIT_ENABLED = False
+    new_row_masks_jit = new_row_masks
+    fits_jit = fits
+    clear_full_rows_jit = clear_full_rows
+else:
+    JIT_ENABLED = True
+    new_row_masks_jit = _new_array_row_masks
+    fits_jit = njit(cache=True)(fits)
+    clear_full_rows_jit = njit(cache=True)(_compact_full_rows)
+
+_warmed_up = False
+
+
+def warm_up() -> None:
+    """Compile the ``*_jit`` functions up front so the first call does not stall."""
+    global _warmed_up
+    if not JIT_ENABLED or _warmed_up:
+        return
+    row_masks = new_row_masks_jit(2)
+    # Piece rotations span one to four rows; each length is its own signature.
+    for length in range(1, 5):
+        fits_jit(row_masks, tuple((dy, 1) for dy in range(length)), 0, len(row_masks))
+    clear_full_rows_jit(row_masks, 1)
+    _warmed_up = True
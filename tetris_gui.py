@@ -11,9 +11,13 @@ import tkinter as tk
 from dataclasses import dataclass
 from typing import Dict, List, Sequence, Tuple
 
+from tetris_core import clear_full_rows, fits, new_row_masks
+
 # Board configuration
 BOARD_WIDTH = 10
 BOARD_HEIGHT = 20
+# Row bitmask of a completely filled line.
+FULL_ROW = (1 << BOARD_WIDTH) - 1
 CELL_SIZE = 30
 TICK_MS = 600
 SPEEDUP_PER_LINE = 15
@@ -23,6 +27,9 @@ MIN_TICK_MS = 120
 Point = Tuple[int, int]
 ShapeRotation = Sequence[Point]
 ShapeDefinition = Sequence[ShapeRotation]
+# A single row of a rotation: (dy, bitmask of occupied dx columns).
+RowBits = Tuple[int, int]
+RotationRows = Tuple[RowBits, ...]
 
 
 @dataclass
@@ -31,12 +38,27 @@ class Tetromino:
 
     name: str
     rotations: ShapeDefinition
-    color: str
+    # Index into COLORS, resolved to a fill only when a cell is drawn.
+    id: int
 
     def rotation(self, index: int) -> ShapeRotation:
         return self.rotations[index % len(self.rotations)]
 
 
+# Cell colors by shape id. Id 0 is reserved for "no shape" (e.g. no falling
+# piece drawn yet) and maps to the canvas background.
+COLORS: Tuple[str, ...] = (
+    "#0f0f0f",
+    "#00c0f0",
+    "#0000f0",
+    "#f0a000",
+    "#f0f000",
+    "#00f000",
+    "#a000f0",
+    "#f00000",
+)
+
+
 SHAPES: Dict[str, Tetromino] = {
     "I": Tetromino(
         "I",
@@ -44,7 +66,7 @@ SHAPES: Dict[str, Tetromino] = {
             ((0, 1), (1, 1), (2, 1), (3, 1)),
             ((2, 0), (2, 1), (2, 2), (2, 3)),
         ),
-        "#00c0f0",
+        1,
     ),
     "J": Tetromino(
         "J",
@@ -54,7 +76,7 @@ SHAPES: Dict[str, Tetromino] = {
             ((0, 1), (1, 1), (2, 1), (2, 2)),
             ((1, 0), (1, 1), (0, 2), (1, 2)),
         ),
-        "#0000f0",
+        2,
     ),
     "L": Tetromino(
         "L",
@@ -64,14 +86,14 @@ SHAPES: Dict[str, Tetromino] = {
             ((0, 1), (1, 1), (2, 1), (0, 2)),
             ((0, 0), (1, 0), (1, 1), (1, 2)),
         ),
-        "#f0a000",
+        3,
     ),
     "O": Tetromino(
         "O",
         (
             ((1, 0), (2, 0), (1, 1), (2, 1)),
         ),
-        "#f0f000",
+        4,
     ),
     "S": Tetromino(
         "S",
@@ -79,7 +101,7 @@ SHAPES: Dict[str, Tetromino] = {
             ((1, 0), (2, 0), (0, 1), (1, 1)),
             ((1, 0), (1, 1), (2, 1), (2, 2)),
         ),
-        "#00f000",
+        5,
     ),
     "T": Tetromino(
         "T",
@@ -89,7 +111,7 @@ SHAPES: Dict[str, Tetromino] = {
             ((0, 1), (1, 1), (2, 1), (1, 2)),
             ((1, 0), (0, 1), (1, 1), (1, 2)),
         ),
-        "#a000f0",
+        6,
     ),
     "Z": Tetromino(
         "Z",
@@ -97,29 +119,144 @@ SHAPES: Dict[str, Tetromino] = {
             ((0, 0), (1, 0), (1, 1), (2, 1)),
             ((2, 0), (1, 1), (2, 1), (1, 2)),
         ),
-        "#f00000",
+        7,
     ),
 }
 
+# Fixed sequence of shapes so spawning a piece does not rebuild a list.
+SHAPE_TUPLE: Tuple[Tetromino, ...] = tuple(SHAPES.values())
+
+
+def rotation_rows(rotation: ShapeRotation) -> RotationRows:
+    """Collapse a rotation's cells into ``(dy, row_bits)`` pairs, one per row."""
+    rows: Dict[int, int] = {}
+    for x, y in rotation:
+        rows[y] = rows.get(y, 0) | (1 << x)
+    return tuple(sorted(rows.items()))
+
+
+# Row bitmasks of every rotation, so collision tests can AND whole rows of the
+# board at once instead of checking cell by cell.
+SHAPE_ROWS: Dict[str, Tuple[RotationRows, ...]] = {
+    name: tuple(rotation_rows(rotation) for rotation in shape.rotations)
+    for name, shape in SHAPES.items()
+}
+
+
+def rotation_span(rows: RotationRows) -> Tuple[int, int]:
+    """Return the ``(min_dx, max_dx)`` columns occupied by a rotation."""
+    columns = 0
+    for _, row_bits in rows:
+        columns |= row_bits
+    return (columns & -columns).bit_length() - 1, columns.bit_length() - 1
+
+
+# Occupied column range of every rotation. A piece at offset x stays between
+# the walls when -min_dx <= x < BOARD_WIDTH - max_dx.
+SHAPE_SPANS: Dict[str, Tuple[Tuple[int, int], ...]] = {
+    name: tuple(rotation_span(rows) for rows in rotations)
+    for name, rotations in SHAPE_ROWS.items()
+}
+
+
+def placed_rows(rows: RotationRows, span: Tuple[int, int]) -> Dict[int, RotationRows]:
+    """Map every in-bounds x offset to the rows shifted into board columns."""
+    min_dx, max_dx = span
+    return {
+        px: tuple(
+            (dy, row_bits << px if px >= 0 else row_bits >> -px) for dy, row_bits in rows
+        )
+        for px in range(-min_dx, BOARD_WIDTH - max_dx)
+    }
+
+
+# PIECE_MASKS[name][rotation][x] holds the board-aligned rows of a piece at
+# column offset x. Offsets that would cross a side wall are simply absent.
+PIECE_MASKS: Dict[str, Tuple[Dict[int, RotationRows], ...]] = {
+    name: tuple(
+        placed_rows(rows, span) for rows, span in zip(rotations, SHAPE_SPANS[name])
+    )
+    for name, rotations in SHAPE_ROWS.items()
+}
+
+
+def bottom_cells(rotation: ShapeRotation) -> Tuple[Point, ...]:
+    """Return ``(dx, dy)`` of the lowest cell in each column of a rotation."""
+    bottoms: Dict[int, int] = {}
+    for x, y in rotation:
+        bottoms[x] = max(bottoms.get(x, y), y)
+    return tuple(sorted(bottoms.items()))
+
+
+# Lowest cell per column of every rotation, used to hard drop a piece straight
+# onto the column heights instead of stepping it down row by row.
+SHAPE_BOTTOMS: Dict[str, Tuple[Tuple[Point, ...], ...]] = {
+    name: tuple(bottom_cells(rotation) for rotation in shape.rotations)
+    for name, shape in SHAPES.items()
+}
+
+# SRS wall kicks for clockwise rotation (the only direction the game rotates),
+# flattened to (dx, dy) pairs: five tests per transition, ten entries per row.
+# Offsets use screen coordinates, with y growing downwards.
+KICKS_JLSTZ: Tuple[int, ...] = (
+    0, 0, -1, 0, -1, -1, 0, 2, -1, 2,  # 0 -> R
+    0, 0, 1, 0, 1, 1, 0, -2, 1, -2,  # R -> 2
+    0, 0, 1, 0, 1, -1, 0, 2, 1, 2,  # 2 -> L
+    0, 0, -1, 0, -1, 1, 0, -2, -1, -2,  # L -> 0
+)
+KICKS_I: Tuple[int, ...] = (
+    0, 0, -2, 0, 1, 0, -2, 1, 1, -2,  # 0 -> R
+    0, 0, -1, 0, 2, 0, -1, -2, 2, 1,  # R -> 2
+    0, 0, 2, 0, -1, 0, 2, -1, -1, 2,  # 2 -> L
+    0, 0, 1, 0, -2, 0, 1, 2, -2, -1,  # L -> 0
+)
+
+# Start index into the kick table for each rotation a piece turns from. Four-
+# state pieces follow the table in order. Two-state pieces only go 0 -> R and
+# back: S and Z use the R -> 2 row, as SRS gives JLSTZ identical R -> 0 and
+# R -> 2 kicks, while I's R -> 0 kicks equal its 2 -> L row.
+KICK_BASES: Dict[str, Tuple[int, ...]] = {
+    "I": (0, 20),
+    "J": (0, 10, 20, 30),
+    "L": (0, 10, 20, 30),
+    "O": (0,),
+    "S": (0, 10),
+    "T": (0, 10, 20, 30),
+    "Z": (0, 10),
+}
+
 
 class TetrisApp:
     """GUI controller for the Tetris game."""
 
-    def __init__(self, root: tk.Tk) -> None:
+    def __init__(self, root: tk.Tk, seed: int | None = None) -> None:
         self.root = root
         self.root.title("Tkinter Tetris")
+        # A private generator avoids the shared module-level instance and lets
+        # a seed replay the same piece sequence.
+        self.rng = random.Random(seed)
         self.score = 0
         self.lines_cleared = 0
         self.tick_ms = TICK_MS
 
-        self.board: List[List[str | None]] = [
-            [None for _ in range(BOARD_WIDTH)] for _ in range(BOARD_HEIGHT)
-        ]
+        # The playfield is stored as one bitmask per row (bit x set = column x
+        # filled). Locked cells are drawn once as they lock (see cell_items),
+        # so no per-cell color grid is kept.
+        self.row_masks = new_row_masks(BOARD_HEIGHT)
+        # Top-most filled row of each column (BOARD_HEIGHT when empty).
+        self.column_heights: List[int] = [BOARD_HEIGHT] * BOARD_WIDTH
         self.current_shape: Tetromino | None = None
         self.current_rotation = 0
         self.current_position = (3, 0)
         self.next_shape = self.random_shape()
         self.game_running = True
+        # A run of same-direction horizontal moves from key repeat is
+        # accumulated here and applied once Tk is idle, so a burst of presses
+        # costs one redraw.
+        self.pending_dx = 0
+        # State changes request a redraw instead of drawing directly; at most
+        # one redraw is queued with after_idle at any time.
+        self.redraw_pending = False
 
         self.canvas = tk.Canvas(
             root,
@@ -128,7 +265,25 @@ class TetrisApp:
             bg="#0f0f0f",
         )
         self.canvas.grid(row=0, column=0, rowspan=4, padx=10, pady=10)
-
+        self.draw_static_grid()
+        # Canvas items are kept across frames and only updated where the game
+        # state changed: locked cells get a permanent rectangle, and the
+        # falling piece reuses four rectangles that are moved around.
+        self.cell_items: Dict[Point, int] = {}
+        self.piece_items: List[int] = [
+            self.canvas.create_rectangle(
+                0, 0, 0, 0, outline="#0f0f0f", state=tk.HIDDEN, tags="piece"
+            )
+            for _ in range(4)
+        ]
+        self.piece_cells: List[Point] = []
+        self.piece_id = 0
+        self.drawn_next_shape: Tetromino | None = None
+
+        # Last text pushed to each StringVar; setting an unchanged value would
+        # still fire Tk traces and relayout the label.
+        self.last_info = ""
+        self.last_status = ""
         self.info_var = tk.StringVar()
         self.info_label = tk.Label(root, textvariable=self.info_var, justify=tk.LEFT)
         self.info_label.grid(row=0, column=1, sticky="nw", padx=(0, 10), pady=10)
@@ -158,25 +313,27 @@ class TetrisApp:
         self.schedule_tick()
 
     def bind_events(self) -> None:
-        self.root.bind("<Left>", lambda _: self.try_move(-1, 0))
-        self.root.bind("<Right>", lambda _: self.try_move(1, 0))
+        self.root.bind("<Left>", lambda _: self.queue_move(-1))
+        self.root.bind("<Right>", lambda _: self.queue_move(1))
         self.root.bind("<Down>", lambda _: self.tick(manual=True))
         self.root.bind("<Up>", lambda _: self.try_rotate())
         self.root.bind("<space>", lambda _: self.hard_drop())
         self.root.bind("<p>", lambda _: self.toggle_pause())
 
     def toggle_pause(self) -> None:
+        self.apply_pending_moves()
         self.game_running = not self.game_running
         if self.game_running:
-            self.status_var.set("")
+            self.set_status("")
             self.schedule_tick()
         else:
-            self.status_var.set("Paused")
+            self.set_status("Paused")
 
     def random_shape(self) -> Tetromino:
-        return random.choice(list(SHAPES.values()))
+        return SHAPE_TUPLE[self.rng.randrange(len(SHAPE_TUPLE))]
 
     def spawn_new_piece(self) -> None:
+        self.request_redraw()
         self.current_shape = self.next_shape
         self.next_shape = self.random_shape()
         self.current_rotation = 0
@@ -184,47 +341,85 @@ class TetrisApp:
         if not self.is_valid_position(self.current_position, self.current_rotation):
             self.end_game()
 
-    def try_move(self, dx: int, dy: int) -> None:
+    def queue_move(self, dx: int) -> None:
         if not self.game_running:
             return
-        new_pos = (self.current_position[0] + dx, self.current_position[1] + dy)
-        if self.is_valid_position(new_pos, self.current_rotation):
-            self.current_position = new_pos
-            self.draw_board()
+        # Only presses in the same direction are combined. A turn applies the
+        # queued run first, so a press blocked by a wall cannot cancel a later
+        # press the other way.
+        if self.pending_dx and (self.pending_dx > 0) != (dx > 0):
+            self.apply_pending_moves()
+        self.pending_dx += dx
+        # The queued redraw applies the accumulated moves before drawing.
+        self.request_redraw()
+
+    def apply_pending_moves(self) -> None:
+        dx, self.pending_dx = self.pending_dx, 0
+        if not dx or not self.game_running:
+            return
+        step = 1 if dx > 0 else -1
+        px, py = self.current_position
+        for _ in range(abs(dx)):
+            if not self.is_valid_position((px + step, py), self.current_rotation):
+                break
+            px += step
+        if (px, py) != self.current_position:
+            self.current_position = (px, py)
+            self.request_redraw()
 
     def try_rotate(self) -> None:
-        if not self.game_running or self.current_shape is None:
-            return
-        new_rot = (self.current_rotation + 1) % len(self.current_shape.rotations)
-        if self.is_valid_position(self.current_position, new_rot):
-            self.current_rotation = new_rot
-            self.draw_board()
+        # Apply queued moves first so inputs keep the order they were made in.
+        self.apply_pending_moves()
+        if self.game_running and self.current_shape is not None:
+            new_rot = (self.current_rotation + 1) % len(self.current_shape.rotations)
+            kicks = KICKS_I if self.current_shape.name == "I" else KICKS_JLSTZ
+            base = KICK_BASES[self.current_shape.name][self.current_rotation]
+            px, py = self.current_position
+            # Try each kick offset in order and keep the first one that fits.
+            for offset in range(base, base + 10, 2):
+                position = (px + kicks[offset], py + kicks[offset + 1])
+                if self.is_valid_position(position, new_rot):
+                    self.current_position = position
+                    self.current_rotation = new_rot
+                    self.request_redraw()
+                    break
 
     def hard_drop(self) -> None:
-        if not self.game_running:
+        self.apply_pending_moves()
+        if not self.game_running or self.current_shape is None:
             return
-        while self.is_valid_position((self.current_position[0], self.current_position[1] + 1), self.current_rotation):
-            self.current_position = (
-                self.current_position[0],
-                self.current_position[1] + 1,
-            )
+        px, py = self.current_position
+        bottoms = SHAPE_BOTTOMS[self.current_shape.name]
+        heights = self.column_heights
+        drop_y = min(
+            heights[px + dx] - 1 - dy
+            for dx, dy in bottoms[self.current_rotation % len(bottoms)]
+        )
+        if drop_y < py:
+            # The piece is tucked under an overhang, so the column heights say
+            # nothing about what lies below it; step down instead.
+            drop_y = py
+            rows = self.piece_rows(px, self.current_rotation)
+            if rows:
+                while self.rows_fit(rows, drop_y + 1):
+                    drop_y += 1
+        self.current_position = (px, drop_y)
         self.lock_piece()
 
     def tick(self, manual: bool = False) -> None:
+        self.apply_pending_moves()
         if not self.game_running or self.current_shape is None:
             return
         new_pos = (self.current_position[0], self.current_position[1] + 1)
         if self.is_valid_position(new_pos, self.current_rotation):
             self.current_position = new_pos
+            # Redraw after every gravity step so the piece visibly falls even
+            # without user input.
+            self.request_redraw()
         else:
             self.lock_piece()
-        # Always redraw after a tick so automatic gravity visibly moves the
-        # piece even without user input.
-        self.draw_board()
         if not manual:
             self.schedule_tick()
-        if manual:
-            self.draw_board()
 
     def lock_piece(self) -> None:
         if self.current_shape is None:
@@ -232,52 +427,122 @@ class TetrisApp:
         for x, y in self.get_blocks(self.current_position, self.current_rotation):
             if y < 0:
                 continue
-            self.board[y][x] = self.current_shape.color
+            self.row_masks[y] |= 1 << x
+            if y < self.column_heights[x]:
+                self.column_heights[x] = y
+            self.cell_items[(x, y)] = self.draw_cell(
+                self.canvas, x, y, self.current_shape.id
+            )
+        # Keep the falling piece above locked cells (they overlap on game over).
+        self.canvas.tag_raise("piece")
         lines = self.clear_lines()
         if lines:
             self.lines_cleared += lines
             self.score += (lines ** 2) * 100
             self.tick_ms = max(MIN_TICK_MS, TICK_MS - self.lines_cleared * SPEEDUP_PER_LINE)
         self.spawn_new_piece()
-        self.draw_board()
 
     def clear_lines(self) -> int:
-        new_board = [row for row in self.board if not all(cell is not None for cell in row)]
-        cleared = BOARD_HEIGHT - len(new_board)
-        while len(new_board) < BOARD_HEIGHT:
-            new_board.insert(0, [None for _ in range(BOARD_WIDTH)])
-        self.board = new_board
+        # Most locks complete no line; skip rebuilding the board for them.
+        if FULL_ROW not in self.row_masks:
+            return 0
+        kept = [y for y, mask in enumerate(self.row_masks) if mask != FULL_ROW]
+        cleared = clear_full_rows(self.row_masks, FULL_ROW)
+        self.shift_cell_items(kept)
+        self.update_column_heights()
         return cleared
 
+    def update_column_heights(self) -> None:
+        heights = [BOARD_HEIGHT] * BOARD_WIDTH
+        for x in range(BOARD_WIDTH):
+            bit = 1 << x
+            for y, mask in enumerate(self.row_masks):
+                if mask & bit:
+                    heights[x] = y
+                    break
+        self.column_heights = heights
+
+    def shift_cell_items(self, kept: List[int]) -> None:
+        """Delete canvas cells of cleared rows and move the rest down."""
+        offset = BOARD_HEIGHT - len(kept)
+        new_rows = {y: offset + index for index, y in enumerate(kept)}
+        items: Dict[Point, int] = {}
+        for (x, y), item in self.cell_items.items():
+            new_y = new_rows.get(y)
+            if new_y is None:
+                self.canvas.delete(item)
+                continue
+            if new_y != y:
+                self.canvas.move(item, 0, (new_y - y) * CELL_SIZE)
+            items[(x, new_y)] = item
+        self.cell_items = items
+
     def get_blocks(self, position: Point, rotation: int) -> List[Point]:
         if self.current_shape is None:
             return []
         px, py = position
         return [(px + x, py + y) for x, y in self.current_shape.rotation(rotation)]
 
+    def piece_rows(self, px: int, rotation: int) -> RotationRows | None:
+        """Board-aligned rows of the current piece, or None if off the sides."""
+        if self.current_shape is None:
+            return ()
+        rotations = PIECE_MASKS[self.current_shape.name]
+        return rotations[rotation % len(rotations)].get(px)
+
+    def rows_fit(self, rows: RotationRows, py: int) -> bool:
+        return not rows or fits(self.row_masks, rows, py, BOARD_HEIGHT)
+
     def is_valid_position(self, position: Point, rotation: int) -> bool:
-        for x, y in self.get_blocks(position, rotation):
-            if x < 0 or x >= BOARD_WIDTH or y >= BOARD_HEIGHT:
-                return False
-            if y >= 0 and self.board[y][x] is not None:
-                return False
-        return True
+        rows = self.piece_rows(position[0], rotation)
+        return rows is not None and self.rows_fit(rows, position[1])
+
+    def request_redraw(self) -> None:
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.root.after_idle(self.do_redraw)
+
+    def do_redraw(self) -> None:
+        # Queued moves may request another redraw; the flag is still set, so
+        # that request is folded into this one.
+        self.apply_pending_moves()
+        self.redraw_pending = False
+        self.draw_board()
 
     def draw_board(self) -> None:
-        self.canvas.delete("all")
-        for y, row in enumerate(self.board):
-            for x, cell in enumerate(row):
-                if cell:
-                    self.draw_cell(self.canvas, x, y, cell)
-        if self.current_shape:
-            for x, y in self.get_blocks(self.current_position, self.current_rotation):
-                if y >= 0:
-                    self.draw_cell(self.canvas, x, y, self.current_shape.color)
-        self.draw_grid()
+        # Locked cells are drawn as they lock (see lock_piece/clear_lines), so
+        # only the falling piece and the side panel need refreshing here.
+        self.draw_piece()
         self.draw_next_shape()
         self.update_ui()
 
-    def draw_grid(self) -> None:
+    def draw_piece(self) -> None:
+        shape = self.current_shape
+        cells: List[Point] = []
+        if shape:
+            cells = [
+                (x, y)
+                for x, y in self.get_blocks(self.current_position, self.current_rotation)
+                if y >= 0
+            ]
+        shape_id = shape.id if shape else 0
+        if cells == self.piece_cells and shape_id == self.piece_id:
+            return
+        if shape_id and shape_id != self.piece_id:
+            for item in self.piece_items:
+                self.canvas.itemconfigure(item, fill=COLORS[shape_id])
+        for index, item in enumerate(self.piece_items):
+            if index < len(cells):
+                self.canvas.coords(item, *self.cell_bounds(*cells[index]))
+                if index >= len(self.piece_cells):
+                    self.canvas.itemconfigure(item, state=tk.NORMAL)
+            elif index < len(self.piece_cells):
+                self.canvas.itemconfigure(item, state=tk.HIDDEN)
+        self.piece_cells = cells
+        self.piece_id = shape_id
+
+    def draw_static_grid(self) -> None:
+        """Draw the grid lines once; they stay on the canvas for the whole session."""
         for x in range(BOARD_WIDTH + 1):
             self.canvas.create_line(
                 x * CELL_SIZE,
@@ -285,6 +550,7 @@ class TetrisApp:
                 x * CELL_SIZE,
                 BOARD_HEIGHT * CELL_SIZE,
                 fill="#222",
+                tags="grid",
             )
         for y in range(BOARD_HEIGHT + 1):
             self.canvas.create_line(
@@ -293,21 +559,25 @@ class TetrisApp:
                 BOARD_WIDTH * CELL_SIZE,
                 y * CELL_SIZE,
                 fill="#222",
+                tags="grid",
             )
 
-    def draw_cell(self, canvas: tk.Canvas, x: int, y: int, color: str) -> None:
+    def cell_bounds(self, x: int, y: int) -> Tuple[int, int, int, int]:
         x0 = x * CELL_SIZE
         y0 = y * CELL_SIZE
-        canvas.create_rectangle(
-            x0 + 1,
-            y0 + 1,
-            x0 + CELL_SIZE - 1,
-            y0 + CELL_SIZE - 1,
-            fill=color,
+        return (x0 + 1, y0 + 1, x0 + CELL_SIZE - 1, y0 + CELL_SIZE - 1)
+
+    def draw_cell(self, canvas: tk.Canvas, x: int, y: int, color_id: int) -> int:
+        return canvas.create_rectangle(
+            *self.cell_bounds(x, y),
+            fill=COLORS[color_id],
             outline="#0f0f0f",
         )
 
     def draw_next_shape(self) -> None:
+        if self.next_shape is self.drawn_next_shape:
+            return
+        self.drawn_next_shape = self.next_shape
         self.next_canvas.delete("all")
         if not self.next_shape:
             return
@@ -316,13 +586,19 @@ class TetrisApp:
                 self.next_canvas,
                 x + 1,
                 y + 1,
-                self.next_shape.color,
+                self.next_shape.id,
             )
 
     def update_ui(self) -> None:
-        self.info_var.set(
-            f"Score: {self.score}\nLines: {self.lines_cleared}\nSpeed: {self.tick_ms} ms"
-        )
+        info = f"Score: {self.score}\nLines: {self.lines_cleared}\nSpeed: {self.tick_ms} ms"
+        if info != self.last_info:
+            self.info_var.set(info)
+            self.last_info = info
+
+    def set_status(self, text: str) -> None:
+        if text != self.last_status:
+            self.status_var.set(text)
+            self.last_status = text
 
     def schedule_tick(self) -> None:
         if self.game_running:
@@ -330,21 +606,25 @@ class TetrisApp:
 
     def end_game(self) -> None:
         self.game_running = False
-        self.status_var.set("Game over. Press R to restart.")
+        self.set_status("Game over. Press R to restart.")
         self.root.bind("<r>", lambda _: self.restart())
 
     def restart(self) -> None:
-        self.board = [[None for _ in range(BOARD_WIDTH)] for _ in range(BOARD_HEIGHT)]
+        self.row_masks = new_row_masks(BOARD_HEIGHT)
+        self.column_heights = [BOARD_HEIGHT] * BOARD_WIDTH
+        if self.cell_items:
+            self.canvas.delete(*self.cell_items.values())
+        self.cell_items = {}
+        self.pending_dx = 0
         self.score = 0
         self.lines_cleared = 0
         self.tick_ms = TICK_MS
-        self.status_var.set("")
+        self.set_status("")
         self.current_shape = None
         self.next_shape = self.random_shape()
         self.game_running = True
         self.root.unbind("<r>")
         self.spawn_new_piece()
-        self.draw_board()
         self.schedule_tick()
 
 